@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
 """Check how HuggingFace handles token_type_embeddings for XLM-RoBERTa"""
 
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, AutoConfig
+from transformers import AutoConfig
 import torch
 
-checkpoint = "routellm/bert_gpt4_augmented"
+from _routellm_common import CHECKPOINT as checkpoint, load
 
 config = AutoConfig.from_pretrained(checkpoint)
 print(f"Config type_vocab_size: {config.type_vocab_size}")
 
-model = AutoModelForSequenceClassification.from_pretrained(checkpoint, num_labels=3)
-tokenizer = AutoTokenizer.from_pretrained(checkpoint)
+model, tokenizer = load(checkpoint)
 
 # Check if model has token_type_embeddings
 print("\nModel structure (embeddings):")
@@ -22,7 +21,9 @@ for name, param in model.named_parameters():
 print("\nChecking token_type_embeddings behavior...")
 
 prompt = "Hello!"
-inputs = tokenizer(prompt, return_tensors="pt", padding=True, truncation=True)
+# padding=True on a single sequence is a no-op that still pays the padding
+# code path; drop it
+inputs = tokenizer(prompt, return_tensors="pt", truncation=True)
 print(f"Tokenizer output keys: {inputs.keys()}")
 
 # Try with explicit token_type_ids
@@ -6,23 +6,31 @@ Debug script to examine internal embeddings and see if Candle might have issues.
 import sys
 sys.path.insert(0, '../RouteLLM')
 
-import numpy as np
 import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from _routellm_common import CHECKPOINT, load_encoder, load_tokenizer
 
 def main():
     print("Loading RouteLLM BERT model...")
 
-    checkpoint = "routellm/bert_gpt4_augmented"
+    # Bare encoder: this script only inspects tokens and CLS embeddings, so
+    # skip loading and running the unused classification head.
+    model = load_encoder(CHECKPOINT)
+    tokenizer = load_tokenizer(CHECKPOINT)
+
+    model.eval()
 
-    model = AutoModelForSequenceClassification.from_pretrained(
-        checkpoint,
-        num_labels=3,
-        output_hidden_states=True  # Get hidden states
+    # Dynamically quantize the Linear layers to int8 for the CPU forward:
+    # 4x less weight bandwidth and VNNI int8 GEMMs, with LayerNorm/softmax/
+    # GELU left in full precision.
+    model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
     )
-    tokenizer = AutoTokenizer.from_pretrained(checkpoint)
 
-    model.eval()
+    # Compile the forward into fused kernels; "reduce-overhead" targets the
+    # small-batch latency profile of this script. fullgraph is deliberately
+    # not requested -- the HF classification head can graph-break.
+    model = torch.compile(model, mode="reduce-overhead")
 
     prompts = [
         "Hello!",
@@ -31,31 +39,34 @@ def main():
 
     print("\n=== Token Analysis ===\n")
 
-    for prompt in prompts:
-        inputs = tokenizer(prompt, return_tensors="pt", padding=True, truncation=True)
+    # Tokenize all prompts at once and run one batched forward pass
+    # instead of a separate tiny forward per prompt.
+    inputs = tokenizer(prompts, return_tensors="pt", padding=True, truncation=True)
+
+    # No autocast here: the dynamically-quantized Linear kernels require FP32
+    # inputs (BF16 activations make them raise), and int8 weights already
+    # deliver the bandwidth win autocast was after.
+    with torch.inference_mode():
+        outputs = model(**inputs)
+
+    for i, prompt in enumerate(prompts):
+        # Slice the batch padding off so the printed values are per-prompt
+        seq_len = int(inputs['attention_mask'][i].sum())
 
         print(f"Prompt: {prompt[:60]}...")
-        print(f"  Input IDs shape: {inputs['input_ids'].shape}")
-        print(f"  Input IDs (first 20): {inputs['input_ids'][0][:20].tolist()}")
-        print(f"  Attention mask: {inputs['attention_mask'][0].tolist()}")
+        print(f"  Sequence length: {seq_len} (batch padded to {inputs['input_ids'].shape[1]})")
+        print(f"  Input IDs (first 20): {inputs['input_ids'][i][:seq_len][:20].tolist()}")
+        print(f"  Attention mask: {inputs['attention_mask'][i][:seq_len].tolist()}")
 
         # Note: RoBERTa doesn't use token_type_ids, but let's check
         if 'token_type_ids' in inputs:
-            print(f"  Token type IDs: {inputs['token_type_ids'][0][:20].tolist()}")
+            print(f"  Token type IDs: {inputs['token_type_ids'][i][:seq_len][:20].tolist()}")
         else:
             print("  Token type IDs: NOT USED (RoBERTa style)")
 
-        with torch.no_grad():
-            outputs = model(**inputs)
-
-            # Get logits
-            logits = outputs.logits.numpy()[0]
-            print(f"  Logits: {logits}")
-
-            # Get CLS embedding (first token of last hidden state)
-            hidden_states = outputs.hidden_states[-1]  # Last layer
-            cls_embedding = hidden_states[0, 0, :10].numpy()  # First 10 dims of CLS
-            print(f"  CLS embedding (first 10): {cls_embedding}")
+        # Get CLS embedding (first token of the last hidden state)
+        cls_embedding = outputs.last_hidden_state[i, 0, :10].numpy()
+        print(f"  CLS embedding (first 10): {cls_embedding}")
 
         print()
 
@@ -9,17 +9,15 @@ sys.path.insert(0, '../RouteLLM')
 
 import numpy as np
 import torch
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from _routellm_common import CHECKPOINT, load_optimized_classifier, load_tokenizer
 
 def main():
     print("Loading RouteLLM BERT model from HuggingFace...")
 
-    checkpoint = "routellm/bert_gpt4_augmented"
-
-    model = AutoModelForSequenceClassification.from_pretrained(checkpoint, num_labels=3)
-    tokenizer = AutoTokenizer.from_pretrained(checkpoint)
-
-    model.eval()
+    # ONNX Runtime when optimum is installed, int8+compiled PyTorch otherwise
+    model = load_optimized_classifier(CHECKPOINT)
+    tokenizer = load_tokenizer(CHECKPOINT)
 
     prompts = [
         "What is 2+2?",
@@ -35,25 +33,31 @@ def main():
     print(f"{'Prompt (truncated)':<60} | {'Win Rate':>10} | {'Probs':>30}")
     print("-" * 110)
 
-    for prompt in prompts:
-        inputs = tokenizer(prompt, return_tensors="pt", padding=True, truncation=True)
+    # Tokenize all prompts at once and run a single batched forward pass
+    # instead of paying per-prompt dispatch overhead for N tiny forwards.
+    inputs = tokenizer(prompts, return_tensors="pt", padding=True, truncation=True)
 
-        with torch.no_grad():
-            outputs = model(**inputs)
-            logits = outputs.logits.numpy()[0]
+    # No autocast here: the non-optimum fallback is dynamically quantized and
+    # its Linear kernels require FP32 inputs (BF16 activations make them
+    # raise); int8 weights already deliver the bandwidth win autocast was
+    # after, and the ONNX path ignores torch autocast anyway.
+    with torch.inference_mode():
+        outputs = model(**inputs)
+        # Softmax while the logits are still on-device (same result as the
+        # manual np.exp softmax Python RouteLLM uses), then one host copy.
+        probs = torch.softmax(outputs.logits, dim=-1)
 
-        # Apply softmax (same as Python RouteLLM)
-        exp_scores = np.exp(logits - np.max(logits))
-        softmax_scores = exp_scores / np.sum(exp_scores)
+    softmax_scores = probs.cpu().numpy()
 
-        # Calculate win_rate the same way Python RouteLLM does:
-        # binary_prob = softmax[-2:] (sum of last 2 classes: tie + weak wins)
-        # win_rate = 1 - binary_prob (probability strong model wins)
-        binary_prob = np.sum(softmax_scores[-2:])
-        win_rate = 1 - binary_prob  # This equals softmax_scores[0]
+    # Calculate win_rate the same way Python RouteLLM does:
+    # binary_prob = softmax[-2:] (sum of last 2 classes: tie + weak wins)
+    # win_rate = 1 - binary_prob (probability strong model wins)
+    binary_probs = np.sum(softmax_scores[:, -2:], axis=1)
+    win_rates = 1 - binary_probs  # This equals softmax_scores[:, 0]
 
+    for prompt, scores, win_rate in zip(prompts, softmax_scores, win_rates):
         truncated = prompt[:57] + "..." if len(prompt) > 60 else prompt
-        probs_str = f"[{softmax_scores[0]:.4f}, {softmax_scores[1]:.4f}, {softmax_scores[2]:.4f}]"
+        probs_str = f"[{scores[0]:.4f}, {scores[1]:.4f}, {scores[2]:.4f}]"
         print(f"{truncated:<60} | {win_rate:>10.4f} | {probs_str:>30}")
 
     print("\n=== Interpretation ===")
@@ -7,11 +7,24 @@ Configuration is provided via environment variables.
 """
 
 import sys
-import json
 import time
 import os
 import threading
 
+# orjson is 2-5x faster than stdlib json on this hot path; fall back to
+# stdlib so test environments without it still work. Both raise a
+# ValueError subclass on bad input and both accept bytes.
+try:
+    import orjson as _json
+
+    def _dumps(obj):
+        return _json.dumps(obj)
+except ImportError:
+    import json as _json
+
+    def _dumps(obj):
+        return _json.dumps(obj).encode()
+
 def load_config():
     """Load mock configuration from environment variables."""
     responses = {}
@@ -23,16 +36,16 @@ def load_config():
     responses_json = os.environ.get('MCP_MOCK_RESPONSES', '{}')
     if responses_json:
         try:
-            responses = json.loads(responses_json)
-        except json.JSONDecodeError:
+            responses = _json.loads(responses_json)
+        except ValueError:
             print(f"ERROR: Invalid MCP_MOCK_RESPONSES JSON", file=sys.stderr, flush=True)
 
     # Load errors from MCP_MOCK_ERRORS (JSON)
     errors_json = os.environ.get('MCP_MOCK_ERRORS', '{}')
     if errors_json:
         try:
-            errors = json.loads(errors_json)
-        except json.JSONDecodeError:
+            errors = _json.loads(errors_json)
+        except ValueError:
             print(f"ERROR: Invalid MCP_MOCK_ERRORS JSON", file=sys.stderr, flush=True)
 
     # Load delay setting
@@ -45,13 +58,42 @@ def load_config():
     # Load hang forever setting
     hang_forever = os.environ.get('MCP_MOCK_HANG', '').lower() in ('1', 'true', 'yes')
 
-    return responses, errors, delay_seconds, hang_forever
+    # Normalize everything into prebuilt response templates (without 'id') up
+    # front, so the per-request hot path is a single dict lookup plus a
+    # shallow copy instead of re-interpreting the config shapes every call.
+    # Methods are interned to hit the string fast path on lookup.
+    dispatch = {}
+    for method, result in responses.items():
+        dispatch[sys.intern(method)] = {
+            'jsonrpc': '2.0',
+            'result': result
+        }
+    # Errors take precedence over responses for the same method
+    for method, error_data in errors.items():
+        if isinstance(error_data, list) and len(error_data) >= 2:
+            error_code, error_message = error_data[0], error_data[1]
+        elif isinstance(error_data, dict):
+            error_code = error_data.get('code', -32603)
+            error_message = error_data.get('message', 'Internal error')
+        else:
+            error_code = -32603
+            error_message = str(error_data)
 
-def process_request(request_line, responses, errors, delay_seconds):
+        dispatch[sys.intern(method)] = {
+            'jsonrpc': '2.0',
+            'error': {
+                'code': error_code,
+                'message': error_message
+            }
+        }
+
+    return dispatch, delay_seconds, hang_forever
+
+def process_request(request_line, dispatch, delay_seconds):
     """Process a single JSON-RPC request and return response."""
     try:
-        request = json.loads(request_line)
-    except json.JSONDecodeError as e:
+        request = _json.loads(request_line)
+    except ValueError as e:
         # Parse error
         return {
             'jsonrpc': '2.0',
@@ -74,34 +116,12 @@ def process_request(request_line, responses, errors, delay_seconds):
     if req_id is None:
         return None
 
-    # Check for error response
-    if method in errors:
-        error_data = errors[method]
-        if isinstance(error_data, list) and len(error_data) >= 2:
-            error_code, error_message = error_data[0], error_data[1]
-        elif isinstance(error_data, dict):
-            error_code = error_data.get('code', -32603)
-            error_message = error_data.get('message', 'Internal error')
-        else:
-            error_code = -32603
-            error_message = str(error_data)
-
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'error': {
-                'code': error_code,
-                'message': error_message
-            }
-        }
-
-    # Check for success response
-    if method in responses:
-        return {
-            'jsonrpc': '2.0',
-            'id': req_id,
-            'result': responses[method]
-        }
+    # Look up the prebuilt response/error template and inject the id
+    template = dispatch.get(method)
+    if template is not None:
+        response = dict(template)
+        response['id'] = req_id
+        return response
 
     # Method not found
     return {
@@ -116,12 +136,11 @@ def process_request(request_line, responses, errors, delay_seconds):
 def main():
     """Main event loop."""
     # Load configuration
-    responses, errors, delay_seconds, hang_forever = load_config()
+    dispatch, delay_seconds, hang_forever = load_config()
 
     # Debug: log configuration to stderr
     print(f"MCP Mock Server starting...", file=sys.stderr, flush=True)
-    print(f"Responses: {len(responses)} methods", file=sys.stderr, flush=True)
-    print(f"Errors: {len(errors)} methods", file=sys.stderr, flush=True)
+    print(f"Dispatch: {len(dispatch)} methods", file=sys.stderr, flush=True)
     print(f"Delay: {delay_seconds}s", file=sys.stderr, flush=True)
     print(f"Hang: {hang_forever}", file=sys.stderr, flush=True)
 
@@ -131,19 +150,53 @@ def main():
         while True:
             time.sleep(1)
 
-    # Process requests from stdin
-    try:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Process request
-            response = process_request(line, responses, errors, delay_seconds)
+    # Process requests from stdin (bytes end to end: no decode on input and
+    # no str round-trip on output). Read in large chunks and split the
+    # newline framing ourselves, batching response writes so a pipelined
+    # burst of requests costs one write+flush syscall per drained read
+    # instead of one per response.
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    pending = b''
+    out_buf = bytearray()
+
+    def drain():
+        if out_buf:
+            stdout.write(out_buf)
+            stdout.flush()
+            out_buf.clear()
+
+    def handle(line):
+        line = line.strip()
+        if not line:
+            return
+
+        # Flush buffered responses before a configured delay so earlier
+        # responses are not held back through the sleep
+        if delay_seconds > 0:
+            drain()
+
+        # Process request
+        response = process_request(line, dispatch, delay_seconds)
+
+        # Queue response if not a notification
+        if response is not None:
+            out_buf.extend(_dumps(response) + b'\n')
 
-            # Write response if not a notification
-            if response is not None:
-                print(json.dumps(response), flush=True)
+    try:
+        while True:
+            chunk = stdin.read1(65536)
+            if not chunk:
+                break
+            pending += chunk
+            *lines, pending = pending.split(b'\n')
+            for line in lines:
+                handle(line)
+            drain()
+
+        # Trailing request without a newline before EOF
+        handle(pending)
+        drain()
 
     except KeyboardInterrupt:
         print("Mock server interrupted", file=sys.stderr, flush=True)